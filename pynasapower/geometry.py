@@ -1,6 +1,37 @@
 import geopandas as gpd
-from shapely.geometry import Polygon
+import pyproj
+import numpy as np
+from shapely.geometry import Point, Polygon, box
 from typing import Union
+from functools import lru_cache
+
+NUMBER = (int, float) # Accepted coordinate types
+WGS84 = pyproj.CRS.from_epsg(4326) # Coordinate system expected by the API
+
+@lru_cache(maxsize=32)
+def _parse_crs(crs:str):
+    """Parse a coordinate system reference code once and reuse it in later calls.
+
+    Parameters:
+        crs (str): Reference code of the coordinate system
+
+    Returns:
+        pyproj.CRS: Parsed coordinate system
+    """
+    return pyproj.CRS.from_user_input(crs)
+
+@lru_cache(maxsize=32)
+def _get_transformer(src:Union[str, pyproj.CRS], dst:Union[str, pyproj.CRS]):
+    """Build the transformer between two coordinate systems once and reuse it in later calls.
+
+    Parameters:
+        src (str or pyproj.CRS): Source coordinate system
+        dst (str or pyproj.CRS): Target coordinate system
+
+    Returns:
+        pyproj.Transformer: Transformer with (x, y) axis order in both coordinate systems
+    """
+    return pyproj.Transformer.from_crs(src, dst, always_xy=True)
 
 def point(x:Union[float, int], y:Union[float, int], crs:str, z:Union[float, int]=None):
     """Generate a Point GeoDataFrame to be inserted in the API client.
@@ -13,14 +44,14 @@ def point(x:Union[float, int], y:Union[float, int], crs:str, z:Union[float, int]
     Returns:
         gpd.GeoDataFrame: Geometry as geodataframe
     """
-    if (not isinstance(x, float)) and (not isinstance(x, int)):
+    if not isinstance(x, NUMBER):
         raise TypeError("X coordinate must be a float or int!")
     
-    if (not isinstance(y, float)) and (not isinstance(y, int)):
+    if not isinstance(y, NUMBER):
         raise TypeError("Y coordinate must be a float")
 
     if z is not None:
-        if (not isinstance(z, float)) and (not isinstance(z, int)):
+        if not isinstance(z, NUMBER):
             raise TypeError("Z coordinate must be a float or int!")
     
     if not isinstance(crs, str):
@@ -29,12 +60,13 @@ def point(x:Union[float, int], y:Union[float, int], crs:str, z:Union[float, int]
     if not crs.startswith("EPSG:"):
         raise ValueError("crs must start with EPSG:... Try to find the reference code at spatialreference.org!")
     
-    geometry = gpd.GeoDataFrame([], geometry=gpd.points_from_xy([x], [y], [z]), crs=crs)
+    coordinates = (x, y) if z is None else (x, y, z)
 
-    if geometry.crs != "EPSG:4326": # Force EPSG:4326 to properly interact with the API 
-        geometry = geometry.to_crs("EPSG:4326")
+    if not _parse_crs(crs).equals(WGS84): # Force EPSG:4326 to properly interact with the API 
+        coordinates = _get_transformer(crs, WGS84).transform(*coordinates)
+        crs = WGS84
 
-    return geometry
+    return gpd.GeoDataFrame(geometry=[Point(*coordinates)], crs=crs)
 
 def bbox(x_min:Union[float, int], x_max:Union[float, int], y_min:Union[float, int], y_max:Union[float, int], crs:str):
     """Create a bounding box polygon using minimum and maximum coordinates along with a coordinate reference system (CRS).
@@ -51,16 +83,16 @@ def bbox(x_min:Union[float, int], x_max:Union[float, int], y_min:Union[float, in
     Returns:
         gpd.GeoDataFrame: A GeoDataFrame containing a bounding box polygon represented as a Shapely Polygon object
     """
-    if (not isinstance(x_min, float)) and (not isinstance(x_min, int)):
+    if not isinstance(x_min, NUMBER):
         raise TypeError("x_min coordinate must be a float or int!")
 
-    if (not isinstance(x_max, float)) and (not isinstance(x_max, int)):
+    if not isinstance(x_max, NUMBER):
         raise TypeError("x_max coordinate must be a float or int!")
 
-    if (not isinstance(y_min, float)) and (not isinstance(y_min, int)):
+    if not isinstance(y_min, NUMBER):
         raise TypeError("y_min coordinate must be a float or int!")  
     
-    if (not isinstance(y_max, float)) and (not isinstance(y_max, int)):
+    if not isinstance(y_max, NUMBER):
         raise TypeError("y_max coordinate must be a float or int!")
 
     if x_min > x_max:
@@ -75,11 +107,14 @@ def bbox(x_min:Union[float, int], x_max:Union[float, int], y_min:Union[float, in
     if not crs.startswith("EPSG:"):
         raise ValueError("crs must start with EPSG:... Try to find the reference code at spatialreference.org!")
     
-    geometry = Polygon([(x_min, y_min), (x_min, y_max), (x_max, y_max), (x_max, y_min)])
+    geometry = box(x_min, y_min, x_max, y_max, ccw=False) # Vertices in the order (x_min, y_min), (x_min, y_max), (x_max, y_max), (x_max, y_min)
+
+    if not _parse_crs(crs).equals(WGS84): # Force EPSG:4326 to properly interact with the API 
+        coords = np.asarray(geometry.exterior.coords)
+        xs, ys = _get_transformer(crs, WGS84).transform(coords[:, 0], coords[:, 1]) # All vertices in one call
+        geometry = Polygon(np.column_stack([xs, ys]))
+        crs = WGS84
 
     bbox = gpd.GeoDataFrame(geometry=[geometry], crs = crs)
     
-    if bbox.crs != "EPSG:4326": # Force EPSG:4326 to properly interact with the API 
-        bbox = bbox.to_crs("EPSG:4326")
-    
     return bbox
\ No newline at end of file
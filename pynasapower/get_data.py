@@ -1,18 +1,162 @@
 import requests
 from requests import exceptions
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import geopandas as gpd
 import pandas as pd
-from io import StringIO
-import xarray as xr
+import numpy as np
+from io import BytesIO
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import gzip
+import orjson
 import os
+import tempfile
 
 DEFAULT_POWER_VARIABLES = ["TOA_SW_DWN", "ALLSKY_SFC_SW_DWN", "T2M", "T2M_MIN", "T2M_MAX", "T2MDEW", "WS2M", "PRECTOTCORR"]
+DEFAULT_POWER_PARAMETERS = ",".join(DEFAULT_POWER_VARIABLES) # Default variables as sent to the API
+POWER_API_URL = "https://power.larc.nasa.gov/api/temporal/{temporal_api}/{spatial_api}?"
 HTTP_OK = 200
+HEADER_END = b"-END HEADER-" # Marker separating the header from the data in csv and ascii responses
+MAX_PARAMETERS = {"hourly": 15, "daily": 20, "monthly": 20, "climatology": 20} # Maximum parameters per request for each temporal_api
+HTTP_UNPROCESSABLE = 422
+MAX_REGIONAL_RANGE = 10 # Maximum latitude/longitude range in degrees accepted by the regional endpoint
+MIN_REGIONAL_RANGE = 2 # Minimum latitude/longitude range in degrees accepted by the regional endpoint
+POWER_FILL_VALUE = -999. # Value used by the API for missing data
+TIME_FORMATS = {"daily": ("%Y%m%d", "D"), "hourly": ("%Y%m%d%H", "h")} # Time stamp format and frequency of contiguous series
+MAX_WORKERS = 8 # Maximum number of concurrent requests to NASA Power
+REQUEST_TIMEOUT = (5, 300) # Connect and read timeout in seconds, large regional requests can take minutes to be served
+
+# Shared session so repeated queries reuse the connection to NASA POWER and retry transient failures.
+# Read errors are not retried, so a stalled request fails once the read timeout expires instead of waiting it out again.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8,
+    max_retries=Retry(total=3, read=0, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)))
+
+def close_session():
+    """
+    Close the connections kept open to NASA Power.
+
+    Long running scripts can call this once they are done querying. A new connection is opened on the next query.
+    """
+    _SESSION.close()
+
+def _check_request(community:str, parameters:list, temporal_api:str):
+    """
+    Validate the arguments shared by every NASA Power query.
+
+    Parameters:
+        community (str): NASA Power community to query data from.
+        parameters (list): List of parameter names to retrieve. An empty list selects DEFAULT_POWER_VARIABLES.
+        temporal_api (str): Temporal resolution for the data.
+
+    Returns:
+        list: Parameter names to retrieve.
+    """
+    available_temporal = ["hourly", "daily", "monthly", "climatology"]
+    if temporal_api not in available_temporal:
+        raise ValueError(f"Argument 'temporal_resolution' must be one of: {', '.join(available_temporal)}")
+    
+    available_communities = ["ag", "sb", "re"]
+    if community not in available_communities:
+        raise ValueError(f"Argument 'community' must be one of: {', '.join(available_communities)}")    
+    
+    if parameters == []:
+        parameters = DEFAULT_POWER_VARIABLES
+
+    if not all(isinstance(p, str) for p in parameters):
+        raise TypeError("Argument 'parameters' must be a list of str.")
+
+    if len(parameters) > MAX_PARAMETERS[temporal_api]:
+        raise ValueError(f"A maximum of {MAX_PARAMETERS[temporal_api]} parameters can currently be requested in one submission.")
+
+    return parameters
+
+def _format_dates(start:datetime.date, end:datetime.date, temporal_api:str):
+    """
+    Validate the temporal range of a query and format it as expected by the API.
+
+    Parameters:
+        start (datetime.date): Start date for the data retrieval.
+        end (datetime.date): End date for the data retrieval.
+        temporal_api (str): Temporal resolution for the data. Only the year is used for "monthly" and "climatology".
+
+    Returns:
+        tuple: Formatted start and end dates (str).
+    """
+    if not isinstance(start, datetime.date):
+        raise TypeError("Argument 'start' must be datetime.date object.")    
+    
+    if not isinstance(end, datetime.date):
+        raise TypeError("Argument 'end' must be datetime.date object.")
+    
+    if start > end:
+        raise ValueError("Argument 'start' cannot be later than 'end'!")
+    
+    # Formatted from the date fields directly, which is cheaper than parsing a strftime format on every request
+    if temporal_api in ["monthly", "climatology"]:
+        start_date = f"{start.year:04d}"
+        end_date = f"{end.year:04d}"
+        if temporal_api == "climatology":
+            if end.year - start.year < 2:
+                raise ValueError("Please provide at least a two year range to compute a climatology.") 
+    else:
+        start_date = f"{start.year:04d}{start.month:02d}{start.day:02d}"
+        end_date = f"{end.year:04d}{end.month:02d}{end.day:02d}"
+
+    return start_date, end_date
+
+def _fetch_power(server:str, params:dict, cache_dir:str = None, session:requests.Session = None):
+    """
+    Retrieve a response from NASA Power, optionally through an on-disk cache.
+
+    Parameters:
+        server (str): API endpoint to query.
+        params (dict): Query parameters of the request.
+        cache_dir (str, optional): Directory holding cached responses. Default is None (no caching).
+        session (requests.Session, optional): Session used for the request. Default is None (the module's shared session).
+
+    Returns:
+        tuple: Raw response content (bytes) and the file name suggested by the server (str).
+    """
+    if cache_dir is not None:
+        key = hashlib.blake2b(repr((server, sorted(params.items()))).encode()).hexdigest()
+        cache_file = os.path.join(cache_dir, key + ".gz")
+        if os.path.exists(cache_file):
+            with gzip.open(cache_file, "rb") as src:
+                name, _, content = src.read().partition(b"\n")
+            return content, name.decode("utf-8")
+
+    print ("Starting retrieval from NASA Power...")
+    request = (session or _SESSION).get(server, params = params, timeout = REQUEST_TIMEOUT)
+    # Check if server didn't respond to HTTP code = 200
+    if request.status_code != HTTP_OK:
+        raise exceptions.HTTPError(f"Failed retrieving POWER data, server returned HTTP code: {request.status_code} on following URL {request.url}.", response = request)
+    # In other case is successful
+    print ("Successfully retrieved data from NASA Power!")
+
+    content = request.content
+    name = request.headers['content-disposition'].split("=")[1]
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok = True)
+        # Write to a uniquely named temporary file first so that an interrupted write never leaves a corrupt entry
+        # and concurrent writers of the same entry, from any thread or process, never share a file
+        fd, tmp_file = tempfile.mkstemp(suffix = ".tmp", dir = cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj = raw, mode = "wb") as dst:
+                dst.write(name.encode("utf-8") + b"\n" + content)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
+    return content, name
 
 def query_power(geometry:gpd.GeoDataFrame, start:datetime.date, end:datetime.date, to_file:bool = True, path:str = "./",
     community:str = "ag", parameters:list = [],  temporal_api:str = "hourly",
-    spatial_api:str = "point", format:str = "csv"):
+    spatial_api:str = "point", format:str = "csv", cache_dir:str = None, session:requests.Session = None):
     """
     Query NASA Power API for climate data based on the specified geometry, temporal range, and parameters.
 
@@ -27,6 +171,8 @@ def query_power(geometry:gpd.GeoDataFrame, start:datetime.date, end:datetime.dat
         temporal_api (str, optional): Temporal resolution for the data (e.g., "hourly", "daily", "monthly", "climatology"). Default is "hourly".
         spatial_api (str, optional): Spatial resolution for the data (e.g., "point", "regional"). Default is "point".
         format (str, optional): Format for the retrieved data files (e.g., "csv", "netcdf", "json", "ascii"). Default is "csv".
+        cache_dir (str, optional): Directory where raw responses are cached so that identical queries do not hit the server again. Default is None (no caching).
+        session (requests.Session, optional): Session to send the request with, e.g. to share its connection pool with other code. Default is None (the module's shared session).
 
     Returns:
         xr.Dataset or pd.DataFrame or dict: Retrieved data in dictionary format in case of format = 'json', pd.DataFrame in case of format = 'csv' or 'ascii' and xr.Dataset in case of format = 'netcdf'.
@@ -39,39 +185,22 @@ def query_power(geometry:gpd.GeoDataFrame, start:datetime.date, end:datetime.dat
         - The format parameter must be one of: "csv", "netcdf", "json", "ascii".
     """
 
-    available_temporal = ["hourly", "daily", "monthly", "climatology"]
-    if temporal_api not in available_temporal:
-        raise ValueError(f"Argument 'temporal_resolution' must be one of: {', '.join(t for t in available_temporal)}")
-    
-    available_communities = ["ag", "sb", "re"]
-    if community not in available_communities:
-        raise ValueError(f"Argument 'community' must be one of: {', '.join(c for c in available_communities)}")    
+    parameters = _check_request(community, parameters, temporal_api)
     
     available_spatial = ["point", "regional"] # No global because NASA does not support it
     if spatial_api not in available_spatial:
-        raise ValueError(f"Argument 'spatial_api' must be one of: {', '.join(s for s in available_spatial)}")
+        raise ValueError(f"Argument 'spatial_api' must be one of: {', '.join(available_spatial)}")
 
     available_formats = ["netcdf", "ascii", "json", "csv"]
     if format not in available_formats:
-        raise ValueError(f"Argument 'format' must be one of: {', '.join(f for f in available_formats)}")
+        raise ValueError(f"Argument 'format' must be one of: {', '.join(available_formats)}")
     
     if temporal_api == "hourly" and spatial_api != "point":
         raise ValueError(f"For temporal_resolution = 'hourly' spatial_api can only be point!")
     
-    if parameters == []:
-        parameters = DEFAULT_POWER_VARIABLES
-
-    if temporal_api == "hourly" and len(parameters)>15:
-        raise ValueError("A maximum of 15 parameters can currently be requested in one submission.")
-    
-    if temporal_api == "daily" and len(parameters)>20:
-        raise ValueError("A maximum of 20 parameters can currently be requested in one submission.")
-    
-    if temporal_api == "monthly" and len(parameters)>20:
-        raise ValueError("A maximum of 20 parameters can currently be requested in one submission.")
-
-    if temporal_api == "climatology" and len(parameters)>20:
-        raise ValueError("A maximum of 20 parameters can currently be requested in one submission.") 
+    # Checked before querying the server so that a wrong path does not cost a full request
+    if to_file and not os.path.isdir(path):
+        raise ValueError(f"Argument 'path' must be an existing directory, got '{path}'.")
 
     # Tests until here
 
@@ -118,29 +247,12 @@ def query_power(geometry:gpd.GeoDataFrame, start:datetime.date, end:datetime.dat
             }
     
 
-    if not isinstance(start, datetime.date):
-        raise TypeError("Argument 'start' must be datetime.date object.")    
-    
-    if not isinstance(end, datetime.date):
-        raise TypeError("Argument 'end' must be datetime.date object.")
-    
-    if start > end:
-        raise ValueError("Argument 'start' cannot be later than 'end'!")
-    
-    if temporal_api in ["monthly", "climatology"]:
-        start_date = start.strftime("%Y")
-        end_date = end.strftime("%Y")
-        if temporal_api == "climatology":
-            if int(end_date) - int(start_date) < 2:
-                raise ValueError("Please provide at least a two year range to compute a climatology.") 
-    else:
-        start_date = start.strftime("%Y%m%d")
-        end_date = end.strftime("%Y%m%d")
+    start_date, end_date = _format_dates(start, end, temporal_api)
     
-    server = f"https://power.larc.nasa.gov/api/temporal/{temporal_api}/{spatial_api}?"
+    server = POWER_API_URL.format(temporal_api = temporal_api, spatial_api = spatial_api)
 
     params = {
-            "parameters": ",".join(parameters),
+            "parameters": DEFAULT_POWER_PARAMETERS if parameters is DEFAULT_POWER_VARIABLES else ",".join(parameters),
             "community": community,
             "start": start_date,
             "end": end_date,
@@ -149,28 +261,22 @@ def query_power(geometry:gpd.GeoDataFrame, start:datetime.date, end:datetime.dat
     
     params.update(coordinates)
     
-    print ("Starting retrieval from NASA Power...")
-    request = requests.get(server, params = params)
-    # Check if server didn't respond to HTTP code = 200
-    if request.status_code != HTTP_OK:
-        raise exceptions.HTTPError(f"Failed retrieving POWER data, server returned HTTP code: {request.status_code} on following URL {request.url}.")
-    # In other case is successful
-    print ("Successfully retrieved data from NASA Power!")
-    
-    name = request.headers['content-disposition'].split("=")[1]
+    content, name = _fetch_power(server, params, cache_dir, session)
     
     if format == "netcdf":
-        data = xr.open_dataset(request.content)
-        data.to_netcdf(os.path.join(path, name))
+        import xarray as xr # Only netCDF responses need xarray, so importing the package does not pay for it
+        data = xr.open_dataset(content)
+        if to_file:
+            data.to_netcdf(os.path.join(path, name))
     elif format == "csv" or format == "ascii":
-        string = request.content.decode("utf-8")
-        # Split the data into header and actual data
-        header, string = string.split("-END HEADER-")
-        data_lines = string.strip().split('\n')
-
-        # Create a StringIO object for the data and load it into a DataFrame
-        data_io = StringIO("\n".join(data_lines))
-        data = pd.read_csv(data_io)
+        # Split the data into header and actual data on the raw bytes, only the header needs decoding
+        header_end = content.find(HEADER_END)
+        if header_end == -1:
+            raise ValueError(f"Unexpected response from NASA Power, '{HEADER_END.decode()}' marker not found.")
+        header = content[:header_end].decode("utf-8")
+        body = content[header_end + len(HEADER_END):].strip()
+
+        data = pd.read_csv(BytesIO(body), engine = "c")
         
         if to_file:
             # Write header to txt
@@ -180,12 +286,233 @@ def query_power(geometry:gpd.GeoDataFrame, start:datetime.date, end:datetime.dat
             if format == "ascii":
                 data.to_csv(os.path.join(path, name), sep='\t', index=False)
             else:
-                data.to_csv(os.path.join(path, name), index=False)
+                # The body is already csv, write it as received instead of serializing the DataFrame again
+                with open(os.path.join(path, name), "wb") as dst:
+                    dst.write(body + b"\n")
     else:
-        string = request.content.decode("utf-8")
-        with open(os.path.join(path, name), "w") as outfile:
-            outfile.write(string)
+        if to_file:
+            with open(os.path.join(path, name), "w") as outfile:
+                outfile.write(content.decode("utf-8"))
         
-        data = request.json()
+        data = orjson.loads(content)
     
-    return data
\ No newline at end of file
+    return data
+
+def query_power_many(geometries:list, start:datetime.date, end:datetime.date, to_file:bool = True, path:str = "./",
+    community:str = "ag", parameters:list = [],  temporal_api:str = "hourly",
+    spatial_api:str = "point", format:str = "csv", cache_dir:str = None, session:requests.Session = None):
+    """
+    Query NASA Power API for several geometries with concurrent requests.
+
+    Each geometry is retrieved with query_power using the same arguments. The requests are network bound, so up to
+    MAX_WORKERS of them are sent at the same time over a shared connection pool.
+
+    Parameters:
+        geometries (list): List of GeoDataFrames, each containing either a Point or a Polygon geometry.
+        start (datetime.date): Start date for the data retrieval in datetime.date format. Note in case of monthly or climatology temporal_api only the year is used.
+        end (datetime.date): End date for the data retrieval in datetime.date format. Note in case of monthly or climatology temporal_api only the year is used.
+        path (str, optional): Path to the directory where the retrieved data files will be saved. Default is './'.
+        to_file (bool, optional): Whether to save the data to files or not. Default is True.
+        community (str, optional): NASA Power community to query data from. Default is "ag".
+        parameters (list, optional): List of parameter names to retrieve. Default is an empty list. If it is not provided variables TOA_SW_DWN, "ALLSKY_SFC_SW_DWN, T2M, T2M_MIN, T2M_MAX, T2MDEW, WS2M, PRECTOTCORR are downloaded.
+        temporal_api (str, optional): Temporal resolution for the data (e.g., "hourly", "daily", "monthly", "climatology"). Default is "hourly".
+        spatial_api (str, optional): Spatial resolution for the data (e.g., "point", "regional"). Default is "point".
+        format (str, optional): Format for the retrieved data files (e.g., "csv", "netcdf", "json", "ascii"). Default is "csv".
+        cache_dir (str, optional): Directory where raw responses are cached so that identical queries do not hit the server again. Default is None (no caching).
+        session (requests.Session, optional): Session to send the requests with. Default is None (the module's shared session).
+
+    Returns:
+        list: Retrieved data of each geometry, in the order of geometries, as returned by query_power.
+    """
+    if isinstance(geometries, gpd.GeoDataFrame):
+        raise TypeError("Argument 'geometries' must be a list of GeoDataFrames. Use query_power() for a single geometry.")
+
+    with ThreadPoolExecutor(max_workers = MAX_WORKERS) as executor:
+        futures = [executor.submit(query_power, geometry, start, end, to_file, path, community, parameters, temporal_api,
+            spatial_api, format, cache_dir, session) for geometry in geometries]
+
+        return [future.result() for future in futures]
+
+def _regional_range(low:float, high:float, limit_low:float, limit_high:float):
+    """
+    Widen a coordinate range to the minimum extent accepted by the regional endpoint.
+
+    Parameters:
+        low (float): Lower coordinate of the range.
+        high (float): Upper coordinate of the range.
+        limit_low (float): Lowest valid value of the coordinate (e.g., -90 for latitude).
+        limit_high (float): Highest valid value of the coordinate (e.g., 90 for latitude).
+
+    Returns:
+        tuple: Lower and upper coordinate of the widened range.
+    """
+    if high - low >= MIN_REGIONAL_RANGE:
+        return low, high
+
+    low = max((low + high) / 2 - MIN_REGIONAL_RANGE / 2, limit_low)
+    high = min(low + MIN_REGIONAL_RANGE, limit_high)
+
+    return high - MIN_REGIONAL_RANGE, high
+
+def _time_index(stamps:list, temporal_api:str):
+    """
+    Convert the time stamps of a contiguous daily or hourly POWER series to a DatetimeIndex.
+
+    Parameters:
+        stamps (list): Time stamps as returned by the API (e.g., "20220101" for daily or "2022010100" for hourly data).
+        temporal_api (str): Temporal resolution of the data, either "daily" or "hourly".
+
+    Returns:
+        pd.DatetimeIndex: Time stamps of the series.
+    """
+    date_format, freq = TIME_FORMATS[temporal_api]
+    index = pd.date_range(pd.to_datetime(stamps[0], format = date_format), periods = len(stamps), freq = freq)
+
+    # Only parse every stamp if the series is not contiguous
+    if index[-1] != pd.to_datetime(stamps[-1], format = date_format):
+        index = pd.DatetimeIndex(pd.to_datetime(stamps, format = date_format, exact = True, cache = True))
+
+    return index
+
+def _parameters_to_dataframe(parameter:dict, parameters:list, temporal_api:str, fill_value:float = POWER_FILL_VALUE,
+    dtype:type = np.float32):
+    """
+    Convert the "parameter" block of a POWER JSON feature to a DataFrame.
+
+    Parameters:
+        parameter (dict): Mapping of parameter names to {time stamp: value} dictionaries.
+        parameters (list): Parameter names to keep, in the order of the output columns.
+        temporal_api (str): Temporal resolution of the data. Daily and hourly time stamps are converted to a DatetimeIndex.
+        fill_value (float, optional): Value used by the server for missing data, replaced by NaN. Default is POWER_FILL_VALUE.
+        dtype (type, optional): Floating point type of the values. Default is np.float32, enough for the two decimals POWER reports.
+
+    Returns:
+        pd.DataFrame: Values indexed by time with one column per parameter.
+    """
+    # All parameters share the same time stamps, so the values are parsed straight into a single array and masked at once.
+    # One row per parameter matches the column-wise layout pandas keeps internally.
+    index = list(parameter[parameters[0]])
+    values = np.empty((len(parameters), len(index)), dtype = dtype)
+    for i, p in enumerate(parameters):
+        values[i] = np.fromiter(parameter[p].values(), dtype = dtype, count = len(index))
+    values[values == values.dtype.type(fill_value)] = np.nan
+
+    if temporal_api in TIME_FORMATS:
+        index = _time_index(index, temporal_api)
+
+    # The array is private to this function, so the DataFrame can take ownership of it without a copy
+    return pd.DataFrame(values.T, index = index, columns = parameters, copy = False)
+
+def _fetch_point_dataframe(server:str, params:dict, parameters:list, temporal_api:str, cache_dir:str = None,
+    dtype:type = np.float32, session:requests.Session = None):
+    """
+    Retrieve the JSON response of the point endpoint as a DataFrame.
+
+    Parameters:
+        server (str): Point API endpoint to query.
+        params (dict): Query parameters of the request, including the point coordinates and format = "json".
+        parameters (list): Parameter names to keep, in the order of the output columns.
+        temporal_api (str): Temporal resolution of the data.
+        cache_dir (str, optional): Directory holding cached responses. Default is None (no caching).
+        dtype (type, optional): Floating point type of the values. Default is np.float32.
+        session (requests.Session, optional): Session used for the request. Default is None (the module's shared session).
+
+    Returns:
+        pd.DataFrame: Values indexed by time with one column per parameter.
+    """
+    content, _ = _fetch_power(server, params, cache_dir, session)
+    response = orjson.loads(content)
+    fill_value = response["header"].get("fill_value", POWER_FILL_VALUE)
+
+    return _parameters_to_dataframe(response["properties"]["parameter"], parameters, temporal_api, fill_value, dtype)
+
+def query_power_points(geometry:gpd.GeoDataFrame, start:datetime.date, end:datetime.date, community:str = "ag",
+    parameters:list = [], temporal_api:str = "daily", cache_dir:str = None, dtype:type = np.float32,
+    session:requests.Session = None):
+    """
+    Query NASA Power API for several points with as few requests as possible.
+
+    The points are grouped into a single regional request covering their bounding box and each point is assigned
+    the grid cell of the response closest to it. Points are queried individually, with concurrent requests, when a regional request is not possible,
+    that is for hourly data, for a bounding box larger than the regional limit or when the server rejects the request.
+
+    Parameters:
+        geometry (gpd.GeoDataFrame): GeoDataFrame containing one or more Point geometries.
+        start (datetime.date): Start date for the data retrieval in datetime.date format. Note in case of monthly or climatology temporal_api only the year is used.
+        end (datetime.date): End date for the data retrieval in datetime.date format. Note in case of monthly or climatology temporal_api only the year is used.
+        community (str, optional): NASA Power community to query data from. Default is "ag".
+        parameters (list, optional): List of parameter names to retrieve. Default is an empty list. If it is not provided variables TOA_SW_DWN, "ALLSKY_SFC_SW_DWN, T2M, T2M_MIN, T2M_MAX, T2MDEW, WS2M, PRECTOTCORR are downloaded.
+        temporal_api (str, optional): Temporal resolution for the data (e.g., "hourly", "daily", "monthly", "climatology"). Default is "daily".
+        cache_dir (str, optional): Directory where raw responses are cached so that identical queries do not hit the server again. Default is None (no caching).
+        dtype (type, optional): Floating point type of the returned values. Default is np.float32, which holds the two decimals reported by POWER in half the memory. Use np.float64 for full precision.
+        session (requests.Session, optional): Session to send the requests with. Default is None (the module's shared session).
+
+    Returns:
+        list: One pd.DataFrame per point, in the order of the input geometry, with one column per parameter. Daily and hourly
+        data are indexed by a DatetimeIndex, monthly and climatology data by the POWER time stamps (e.g., "202201" or "JAN").
+    """
+    parameters = _check_request(community, parameters, temporal_api)
+
+    if not np.issubdtype(dtype, np.floating):
+        raise TypeError("Argument 'dtype' must be a floating point type (e.g., np.float32 or np.float64).")
+
+    if not isinstance(geometry, gpd.GeoDataFrame):
+        raise TypeError("Argument 'geometry' must be a GeoDataframe.")
+
+    if len(geometry) == 0:
+        raise ValueError("At least one geometry must be provided.")
+
+    if (geometry.geom_type != "Point").any():
+        raise ValueError("Argument geometry must only contain Points. Try to use pynasapower.geometry.point() to create valid points.")
+
+    if geometry.crs is not None and geometry.crs != "EPSG:4326": # Force EPSG:4326 to properly interact with the API
+        geometry = geometry.to_crs("EPSG:4326")
+
+    start_date, end_date = _format_dates(start, end, temporal_api)
+
+    latitudes = geometry.geometry.y.to_numpy()
+    longitudes = geometry.geometry.x.to_numpy()
+
+    params = {
+            "parameters": DEFAULT_POWER_PARAMETERS if parameters is DEFAULT_POWER_VARIABLES else ",".join(parameters),
+            "community": community,
+            "start": start_date,
+            "end": end_date,
+            "format": "json"
+            }
+
+    if temporal_api != "hourly": # Hourly data are only served by the point endpoint
+        latitude_min, latitude_max = _regional_range(latitudes.min(), latitudes.max(), -90., 90.)
+        longitude_min, longitude_max = _regional_range(longitudes.min(), longitudes.max(), -180., 180.)
+
+        if (latitude_max - latitude_min <= MAX_REGIONAL_RANGE) and (longitude_max - longitude_min <= MAX_REGIONAL_RANGE):
+            server = POWER_API_URL.format(temporal_api = temporal_api, spatial_api = "regional")
+            coordinates = {
+                "latitude-min": latitude_min,
+                "latitude-max": latitude_max,
+                "longitude-min": longitude_min,
+                "longitude-max": longitude_max,
+                }
+            try:
+                content, _ = _fetch_power(server, {**params, **coordinates}, cache_dir, session)
+            except exceptions.HTTPError as error:
+                if error.response is None or error.response.status_code != HTTP_UNPROCESSABLE:
+                    raise
+                # The server refused the region, fall back to one request per point
+            else:
+                response = orjson.loads(content)
+                fill_value = response["header"].get("fill_value", POWER_FILL_VALUE)
+                features = response["features"]
+                cells = np.array([feature["geometry"]["coordinates"][:2] for feature in features])
+                # Index of the grid cell closest to each point
+                nearest = ((cells[:, 0, None] - longitudes) ** 2 + (cells[:, 1, None] - latitudes) ** 2).argmin(axis = 0)
+                return [_parameters_to_dataframe(features[i]["properties"]["parameter"], parameters, temporal_api, fill_value, dtype) for i in nearest]
+
+    server = POWER_API_URL.format(temporal_api = temporal_api, spatial_api = "point")
+    points = [{**params, "latitude": latitude, "longitude": longitude} for latitude, longitude in zip(latitudes, longitudes)]
+    # The requests are network bound, so they are sent concurrently over the session
+    with ThreadPoolExecutor(max_workers = MAX_WORKERS) as executor:
+        data = list(executor.map(lambda point_params: _fetch_point_dataframe(server, point_params, parameters, temporal_api, cache_dir, dtype,
+            session), points))
+
+    return data
@@ -0,0 +1,143 @@
+import os
+import pytest
+import requests
+import orjson
+import numpy as np
+import geopandas as gpd
+import shapely
+from shapely.geometry import Point
+from pynasapower import get_data
+from pynasapower.geometry import point, bbox
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+# Canned NASA Power responses served to the tests, keyed by (temporal_api, spatial_api, format)
+RESPONSES = {
+    ("daily", "point", "csv"): "POWER_Point_Daily_20220101_20220201_037d98N_023d73E_LST.csv",
+    ("daily", "point", "ascii"): "POWER_Point_Daily_20220101_20220201_037d98N_023d73E_LST.txt",
+    ("monthly", "regional", "netcdf"): "POWER_Regional_Monthly_20220101_20221231_037d00N_039d00N_023d00E_025d00E_UTC.nc",
+    ("monthly", "regional", "json"): "POWER_Regional_Monthly_20220101_20221231_037d00N_039d00N_023d00E_025d00E_UTC.json",
+    }
+
+class PowerResponse:
+    """Stand-in for the requests.Response of NASA Power, built from a file in tests/data."""
+
+    def __init__(self, url, name = None):
+        self.url = url
+        self.status_code = 200 if name is not None else 404
+        self.headers = {"content-disposition": f"attachment; filename={name}"}
+        self.content = read_response(name) if name is not None else b""
+
+def read_response(name):
+    """Rebuild the raw response body that query_power stored as the file name."""
+    with open(os.path.join(DATA, name), "rb") as src:
+        content = src.read()
+
+    if name.endswith((".csv", ".txt")):
+        # The header of csv and ascii responses is stored separately by query_power
+        with open(os.path.join(DATA, name.split(".")[0] + "_variables.txt"), "rb") as src:
+            content = src.read() + b"-END HEADER-\n" + content
+
+    return content
+
+def fake_get(url, params = None, **kwargs):
+    """Replacement of the session get, answers with the canned response matching the endpoint and format."""
+    temporal_api, spatial_api = url.rstrip("?").split("/")[-2:]
+    return PowerResponse(url, RESPONSES.get((temporal_api, spatial_api, params["format"])))
+
+def pytest_addoption(parser):
+    parser.addoption("--power-live", action="store_true", default=False,
+        help="run the tests marked integration against the live NASA Power API")
+
+def pytest_collection_modifyitems(config, items):
+    # Tests marked as integration only make sense against the live API
+    if config.getoption("--power-live"):
+        return
+    skip_live = pytest.mark.skip(reason="needs --power-live to query NASA Power")
+    for item in items:
+        if item.get_closest_marker("integration") is not None:
+            item.add_marker(skip_live)
+
+@pytest.fixture(autouse=True)
+def mock_power(request, monkeypatch):
+    """Serve canned responses instead of querying NASA Power.
+
+    Only tests marked as integration reach the live API, the rest assert the content of the canned responses
+    and keep them even when the run was started with --power-live.
+    """
+    if request.node.get_closest_marker("integration") is None:
+        monkeypatch.setattr(get_data._SESSION, "get", fake_get)
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    """Run every test from its own temporary directory so that stray files never land in the repository."""
+    monkeypatch.chdir(tmp_path)
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Session shared by the live tests so they reuse one pooled connection to NASA Power."""
+    session = requests.Session()
+    yield session
+    session.close()
+
+# Geometries are built once per session and only when a selected test requests them,
+# so collecting or filtering the tests does not pay for the CRS setup.
+
+@pytest.fixture(scope="session")
+def gpoint():
+    return point(23.727539, 37.983810, "EPSG:4326")
+
+@pytest.fixture(scope="session")
+def gbbox():
+    return bbox(23., 25., 37., 39., "EPSG:4326")
+
+# For testing in regional request latitude and longitude values more than 2 degrees.
+@pytest.fixture(scope="session")
+def gbbox_invalid_lon():
+    return bbox(20., 20.1, 37., 39.1, "EPSG:4326")
+
+@pytest.fixture(scope="session")
+def gbbox_invalid_lat():
+    return bbox(20., 22.1, 37., 37.1, "EPSG:4326")
+
+# For testing with an empty geometry
+@pytest.fixture(scope="session")
+def gdf_empty():
+    return gpd.GeoDataFrame(geometry=[], crs="EPSG:4326")
+
+# For testing with points inside the cells of the canned regional response,
+# their bounding box is widened to the 37-39N, 23-25E region of that response
+@pytest.fixture(scope="session")
+def gdf_grid_points():
+    data = {'ID': [1, 2, 3], 'geometry': [Point(23.3, 37.3), Point(24.7, 38.7), Point(23.8, 38.2)]}
+    return gpd.GeoDataFrame(data, geometry='geometry', crs="EPSG:4326")
+
+@pytest.fixture(scope="session")
+def regional_json():
+    """Parsed canned response of the monthly regional endpoint."""
+    with open(os.path.join(DATA, RESPONSES[("monthly", "regional", "json")]), "rb") as src:
+        return orjson.loads(src.read())
+
+# For testing with multiple points geometry
+@pytest.fixture(scope="session")
+def gdf_two_points():
+    # Generate seeded random coordinates for two points
+    rng = np.random.default_rng(0)
+    coordinates = rng.uniform([-180, -90], [180, 90], size = (2, 2))
+    # Create a GeoDataFrame with the random points
+    data = {'ID': [1, 2], 'geometry': [Point(x, y) for x, y in coordinates]}
+    return gpd.GeoDataFrame(data, geometry='geometry')
+
+# For testing with multipolygon
+@pytest.fixture(scope="session")
+def multipolygon_gdf():
+    rng = np.random.default_rng(0)
+    # Number of polygons in the MultiPolygon and of vertices in each one
+    num_points = rng.integers(3, 11, size = rng.integers(1, 6))
+
+    # Generate all vertices at once and build the polygons in one vectorized call
+    coordinates = rng.uniform([-180, -90], [180, 90], size = (num_points.sum(), 2))
+    rings = shapely.linearrings(coordinates, indices = np.repeat(np.arange(len(num_points)), num_points))
+
+    # Create a GeoDataFrame with the random MultiPolygon
+    return gpd.GeoDataFrame(geometry=[shapely.multipolygons(shapely.polygons(rings))])
@@ -0,0 +1,12 @@
+import pytest
+from contextlib import suppress as do_not_raise
+
+# Expected exceptions are stored as classes in the parametrize data, None when the call must succeed
+
+def expect(exception):
+    """Context manager checking that the exception class is raised, or that nothing is when it is None."""
+    return pytest.raises(exception) if exception is not None else do_not_raise()
+
+def name_exception(value):
+    """Name exception classes in the test ids and leave the rest to pytest."""
+    return value.__name__ if isinstance(value, type) else None
@@ -1,57 +1,39 @@
 import os
 import pytest
-import geopandas as gpd
-from shapely.geometry import Point, Polygon, MultiPolygon
-from contextlib import suppress as do_not_raise
+from shapely.geometry import Point
+from helpers import expect, name_exception
+import copy
 import datetime
-from pynasapower.get_data import query_power
-from pynasapower.geometry import point, bbox
-import random
+import time
+from types import SimpleNamespace
+from pynasapower import get_data
+from pynasapower.get_data import query_power, query_power_many, query_power_points
 import string
+import numpy as np
+import orjson
 import pandas as pd
-import xarray as xr
 
-gpoint = point(23.727539, 37.983810, "EPSG:4326")
-gbbox = bbox(23., 25., 37., 39., "EPSG:4326")
+# Geometries given by name are session fixtures defined in conftest.py
 start = datetime.date(2022, 1, 1)
 end = datetime.date(2022, 2, 1)
 
 
+def resolve(request, geometry):
+    """Replace fixture names, also inside lists, with the fixture values."""
+    if isinstance(geometry, str):
+        return request.getfixturevalue(geometry)
+    if isinstance(geometry, list):
+        return [resolve(request, g) for g in geometry]
+    return geometry
+
 # For testing with random letters as parameters
-r_params = [random.choice(string.ascii_letters) for _ in range(21)]
+r_params = np.random.default_rng(0).choice(list(string.ascii_letters), size = 21).tolist()
 # ----
 
 # For testing with wrong geometry
 wrong_geom = Point([0.0, 1.0])
 # ----
 
-# For testing with multiple points geometry
-# Generate random coordinates for two points
-point1 = Point(random.uniform(-180, 180), random.uniform(-90, 90))
-point2 = Point(random.uniform(-180, 180), random.uniform(-90, 90))
-# Create a GeoDataFrame with the random points
-data = {'ID': [1, 2], 'geometry': [point1, point2]}
-gdf_two_points = gpd.GeoDataFrame(data, geometry='geometry')
-# ----
-
-# For testing with multipolygon
-# Number of polygons in the MultiPolygon
-num_polygons = random.randint(1, 5)
-
-# Generate random polygons and create a MultiPolygon
-polygons = []
-for _ in range(num_polygons):
-    num_points = random.randint(3, 10)
-    coordinates = [(random.uniform(-180, 180), random.uniform(-90, 90)) for _ in range(num_points)]
-    polygon = Polygon(coordinates)
-    polygons.append(polygon)
-
-multipolygon = MultiPolygon(polygons)
-
-# Create a GeoDataFrame with the random MultiPolygon
-multipolygon = gpd.GeoDataFrame(geometry=[multipolygon])
-# ----
-
 # For testing dates
 wrong_start_date_format = "20170101"
 wrong_end_date_format = "20180101"
@@ -61,37 +43,45 @@ wrong_end_date_format = "20180101"
 start_later = datetime.date(2022, 4, 1)
 end_later = datetime.date(2022, 2, 1)
 
-# For testing in regional request latitude and longitude values more than 2 degrees.
-gbbox_invalid_lon = bbox(20., 20.1, 37., 39.1, "EPSG:4326")
-gbbox_invalid_lat = bbox(20., 22.1, 37., 37.1, "EPSG:4326")
+# Arguments of a valid query_power call; each invalid case overrides only what it tests.
+# Nothing is written by default since the invalid cases raise before any file is created.
+BASE = dict(geometry="gpoint", start=start, end=end, to_file=False, path="./",
+    community="ag", parameters=[], temporal_api="hourly", spatial_api="point", format="csv")
 
-params = [
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "random", "point", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "random", [], "hourly", "point", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "hourly", "random", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "hourly", "point", "random", pytest.raises(ValueError)),
-    (gbbox, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "hourly", "regional", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", r_params, "hourly", "point", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", r_params, "daily", "point", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", r_params, "monthly", "point", "csv", pytest.raises(ValueError)),
-    (wrong_geom, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "point", "csv", pytest.raises(TypeError)),
-    (gdf_two_points, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "point", "csv", pytest.raises(ValueError)),
-    (multipolygon, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "regional", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "regional", "csv", pytest.raises(ValueError)),
-    (gbbox, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "point", "csv", pytest.raises(ValueError)),
-    (gpoint, wrong_start_date_format, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "point", "csv", pytest.raises(TypeError)),
-    (gpoint, start, wrong_end_date_format, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "point", "csv", pytest.raises(TypeError)),
-    (gpoint, start_later, end_later, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "point", "csv", pytest.raises(ValueError)),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "climatology", "point", "csv", pytest.raises(ValueError)),
-    (gbbox_invalid_lon, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "regional", "csv", pytest.raises(ValueError)),
-    (gbbox_invalid_lat, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "regional", "csv", pytest.raises(ValueError)),
+def case(exception, **overrides):
+    """Build an invalid case from BASE and overrides, named after the overridden arguments."""
+    name = "-".join(f"{k}={v}" if isinstance(v, str) else k for k, v in overrides.items())
+    return name, {**BASE, **overrides}, exception
 
+params = [
+    case(ValueError, temporal_api="random"),
+    case(ValueError, community="random"),
+    case(ValueError, spatial_api="random"),
+    case(ValueError, format="random"),
+    case(ValueError, geometry="gbbox", spatial_api="regional"),
+    case(ValueError, parameters=r_params),
+    case(ValueError, parameters=r_params, temporal_api="daily"),
+    case(ValueError, parameters=r_params, temporal_api="monthly"),
+    case(TypeError, geometry=wrong_geom, temporal_api="monthly"),
+    case(ValueError, geometry="gdf_two_points", temporal_api="monthly"),
+    case(ValueError, geometry="multipolygon_gdf", temporal_api="monthly", spatial_api="regional"),
+    case(ValueError, temporal_api="monthly", spatial_api="regional"),
+    case(ValueError, geometry="gbbox", temporal_api="monthly"),
+    case(TypeError, start=wrong_start_date_format, temporal_api="monthly"),
+    case(TypeError, end=wrong_end_date_format, temporal_api="monthly"),
+    case(ValueError, start=start_later, end=end_later, temporal_api="monthly"),
+    case(ValueError, temporal_api="climatology"),
+    case(ValueError, geometry="gbbox_invalid_lon", temporal_api="monthly", spatial_api="regional"),
+    case(ValueError, geometry="gbbox_invalid_lat", temporal_api="monthly", spatial_api="regional"),
+    case(ValueError, to_file=True, path=os.path.join(os.path.dirname(__file__), "missing"), temporal_api="daily"),
+    case(TypeError, parameters=[1, 2], temporal_api="daily"),
     ]
 
-@pytest.mark.parametrize("geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format, exception", params,)
-def test_get_data_invalid(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format, exception):
-    with exception:  
-        result = query_power(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format)
+# The cases only exercise argument validation, so they run as subtests of a single test
+def test_get_data_invalid(request, subtests):
+    for name, arguments, exception in params:
+        with subtests.test(msg = name), expect(exception):
+            query_power(**{**arguments, "geometry": resolve(request, arguments["geometry"])})
 
 # For testing climatology
 
@@ -99,29 +89,236 @@ start_climatology = datetime.date(2020, 1, 1)
 end_climatology = datetime.date(2022, 1, 1)
 
 params_valid_csv = [
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "daily", "point", "csv"),
-    (gpoint, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "daily", "point", "ascii"),
+    ("gpoint", start, end, True, "ag", [], "daily", "point", "csv"),
+    ("gpoint", start, end, True, "ag", [], "daily", "point", "ascii"),
+    ("gpoint", start, end, False, "ag", [], "daily", "point", "csv"),
     ]
 
-@pytest.mark.parametrize("geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format", params_valid_csv,)
-def test_get_data_valid_csv(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format):
-    result = query_power(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format)
+@pytest.mark.parametrize("geometry, start, end, to_file, community, parameters, temporal_api, spatial_api, format", params_valid_csv,)
+def test_get_data_valid_csv(request, tmp_path, geometry, start, end, to_file, community, parameters, temporal_api, spatial_api, format):
+    result = query_power(resolve(request, geometry), start, end, to_file, str(tmp_path), community, parameters, temporal_api, spatial_api, format)
     assert isinstance(result, pd.DataFrame)
+    # The test runs from tmp_path, so files written to the current directory would show up there as well
+    assert bool(os.listdir(tmp_path)) == to_file
 
 params_valid_netcdf = [
-    (gbbox, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "regional", "netcdf"),
+    ("gbbox", start, end, True, "ag", [], "monthly", "regional", "netcdf"),
+    ("gbbox", start, end, False, "ag", [], "monthly", "regional", "netcdf"),
     ]
 
-@pytest.mark.parametrize("geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format", params_valid_netcdf,)
-def test_get_data_valid_netcdf(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format):
-    result = query_power(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format)
+@pytest.mark.slow
+@pytest.mark.parametrize("geometry, start, end, to_file, community, parameters, temporal_api, spatial_api, format", params_valid_netcdf,)
+def test_get_data_valid_netcdf(request, tmp_path, geometry, start, end, to_file, community, parameters, temporal_api, spatial_api, format):
+    xr = pytest.importorskip("xarray")
+    result = query_power(resolve(request, geometry), start, end, to_file, str(tmp_path), community, parameters, temporal_api, spatial_api, format)
     assert isinstance(result, xr.Dataset)
+    # The test runs from tmp_path, so files written to the current directory would show up there as well
+    assert bool(os.listdir(tmp_path)) == to_file
 
 params_valid_json = [
-    (gbbox, start, end, True, os.path.join(os.path.dirname(__file__), "data"), "ag", [], "monthly", "regional", "json"),
+    ("gbbox", start, end, True, "ag", [], "monthly", "regional", "json"),
+    ("gbbox", start, end, False, "ag", [], "monthly", "regional", "json"),
+    ]
+
+@pytest.mark.parametrize("geometry, start, end, to_file, community, parameters, temporal_api, spatial_api, format", params_valid_json,)
+def test_get_data_valid_json(request, tmp_path, geometry, start, end, to_file, community, parameters, temporal_api, spatial_api, format):
+    result = query_power(resolve(request, geometry), start, end, to_file, str(tmp_path), community, parameters, temporal_api, spatial_api, format)
+    assert isinstance(result, dict)
+    # The test runs from tmp_path, so files written to the current directory would show up there as well
+    assert bool(os.listdir(tmp_path)) == to_file
+
+def test_session_retries():
+    # Connect errors and busy responses are retried, a stalled read is not
+    retries = get_data._SESSION.get_adapter(get_data.POWER_API_URL).max_retries
+    assert retries.total == 3
+    assert retries.read == 0
+    assert 503 in retries.status_forcelist
+
+def test_get_data_cache_hit(gpoint, tmp_path, monkeypatch):
+    first = query_power(gpoint, start, end, False, "./", "ag", [], "daily", "point", "csv", cache_dir = str(tmp_path))
+    # A cached query is answered from disk without reaching the server
+    def get(url, **kwargs):
+        raise AssertionError("cached query reached the server")
+    monkeypatch.setattr(get_data._SESSION, "get", get)
+    second = query_power(gpoint, start, end, False, "./", "ag", [], "daily", "point", "csv", cache_dir = str(tmp_path))
+    pd.testing.assert_frame_equal(first, second)
+
+def test_get_data_cache_concurrent(gpoint, tmp_path, monkeypatch):
+    # Slow responses make every worker miss the cache and write the same entry at the same time
+    canned = get_data._SESSION.get
+    def get(url, **kwargs):
+        time.sleep(.05)
+        return canned(url, **kwargs)
+    monkeypatch.setattr(get_data._SESSION, "get", get)
+    results = query_power_many([gpoint] * 8, start, end, False, "./", "ag", [], "daily", "point", "csv", cache_dir = str(tmp_path))
+    assert len(results) == 8
+    assert [f.endswith(".gz") for f in os.listdir(tmp_path)] == [True]
+
+def test_get_data_session(gpoint):
+    # A given session is used instead of the shared one, here it forwards to the mocked shared session
+    urls = []
+    def get(url, **kwargs):
+        urls.append(url)
+        return get_data._SESSION.get(url, **kwargs)
+    result = query_power(gpoint, start, end, False, "./", "ag", [], "daily", "point", "csv", session = SimpleNamespace(get = get))
+    assert isinstance(result, pd.DataFrame)
+    assert len(urls) == 1
+
+@pytest.mark.integration
+def test_get_data_live(gpoint, http_session):
+    result = query_power(gpoint, start, end, False, "./", "ag", [], "daily", "point", "csv", session = http_session)
+    assert isinstance(result, pd.DataFrame)
+
+params_points_invalid = [
+    ("gpoint", start, end, "random", [], "daily", ValueError),
+    ("gpoint", start, end, "ag", r_params, "daily", ValueError),
+    (wrong_geom, start, end, "ag", [], "daily", TypeError),
+    ("gbbox", start, end, "ag", [], "daily", ValueError),
+    ("gdf_empty", start, end, "ag", [], "daily", ValueError),
+    ("gdf_two_points", wrong_start_date_format, end, "ag", [], "daily", TypeError),
+    ("gdf_two_points", start_later, end_later, "ag", [], "daily", ValueError),
+    ]
+
+@pytest.mark.parametrize("geometry, start, end, community, parameters, temporal_api, exception", params_points_invalid, ids = name_exception)
+def test_query_power_points_invalid(request, geometry, start, end, community, parameters, temporal_api, exception):
+    with expect(exception):
+        result = query_power_points(resolve(request, geometry), start, end, community, parameters, temporal_api)
+
+def test_query_power_points_invalid_dtype(gdf_two_points):
+    with pytest.raises(TypeError):
+        query_power_points(gdf_two_points, start, end, dtype = int)
+
+# Monthly data of 2022, served by the canned regional response
+start_monthly = datetime.date(2022, 1, 1)
+end_monthly = datetime.date(2022, 12, 31)
+
+def test_query_power_points_regional(gdf_grid_points, regional_json, monkeypatch):
+    calls = []
+    canned = get_data._SESSION.get
+    def get(url, params = None, **kwargs):
+        calls.append((url, params))
+        return canned(url, params = params, **kwargs)
+    monkeypatch.setattr(get_data._SESSION, "get", get)
+
+    result = query_power_points(gdf_grid_points, start_monthly, end_monthly, temporal_api = "monthly")
+
+    # A single regional request widened to the 2 degrees minimum around the points
+    assert len(calls) == 1
+    url, params = calls[0]
+    assert url.endswith("/monthly/regional?")
+    assert (params["latitude-min"], params["latitude-max"]) == pytest.approx((37., 39.))
+    assert (params["longitude-min"], params["longitude-max"]) == pytest.approx((23., 25.))
+
+    # Each point gets the cell it lies in: (23.25, 37.25), (24.75, 38.75) and (23.75, 38.25)
+    features = regional_json["features"]
+    assert len(result) == 3
+    for frame, cell in zip(result, (0, 15, 9)):
+        parameter = features[cell]["properties"]["parameter"]
+        assert list(frame.columns) == list(get_data.DEFAULT_POWER_VARIABLES)
+        assert list(frame.index) == list(parameter["T2M"])
+        np.testing.assert_allclose(frame["T2M"].to_numpy(), list(parameter["T2M"].values()), atol = 1e-4)
+
+@pytest.mark.parametrize("dtype", [None, np.float32, np.float64])
+def test_query_power_points_dtype(gdf_grid_points, dtype):
+    # None keeps the default of query_power_points, float32
+    kwargs = {} if dtype is None else {"dtype": dtype}
+    result = query_power_points(gdf_grid_points, start_monthly, end_monthly, temporal_api = "monthly", **kwargs)
+    for frame in result:
+        assert (frame.dtypes == (dtype or np.float32)).all()
+
+def test_query_power_points_unprocessable(gdf_grid_points, regional_json):
+    # The server rejects the region, each point is then queried on its own through the given session
+    feature = regional_json["features"][0]
+    point_response = orjson.dumps({"header": regional_json["header"], "properties": feature["properties"]})
+    urls = []
+    def get(url, params = None, **kwargs):
+        urls.append(url)
+        if url.endswith("/regional?"):
+            return SimpleNamespace(status_code = 422, url = url, headers = {}, content = b"")
+        return SimpleNamespace(status_code = 200, url = url, headers = {"content-disposition": "attachment; filename=point.json"},
+            content = point_response)
+
+    result = query_power_points(gdf_grid_points, start_monthly, end_monthly, temporal_api = "monthly", session = SimpleNamespace(get = get))
+
+    assert urls[0].endswith("/monthly/regional?")
+    assert [url.endswith("/monthly/point?") for url in urls[1:]] == [True] * 3
+    assert len(result) == 3
+    for frame in result:
+        assert list(frame.index) == list(feature["properties"]["parameter"]["T2M"])
+
+# -99.99 has no exact float32 representation, so the sentinel must be converted to the dtype before comparing
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("fill_value", [-999., -99.99])
+def test_parameters_to_dataframe_fill_value(dtype, fill_value):
+    parameter = {
+        "T2M": {"20220101": 1.5, "20220102": fill_value},
+        "WS2M": {"20220101": fill_value, "20220102": 2.25},
+        }
+    frame = get_data._parameters_to_dataframe(parameter, ["T2M", "WS2M"], "daily", fill_value, dtype)
+    # The fill value of the server is replaced by NaN, the rest is kept
+    assert (frame.dtypes == dtype).all()
+    assert frame.isna().to_numpy().tolist() == [[False, True], [True, False]]
+    assert frame.loc["2022-01-01", "T2M"] == 1.5
+    assert frame.loc["2022-01-02", "WS2M"] == 2.25
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("regional", [True, False], ids = ["regional", "point"])
+def test_query_power_points_fill_value(gdf_grid_points, regional_json, regional, dtype):
+    # Responses declaring their own fill value, used for the first month of every cell
+    fill_value = -99.99
+    header = {**regional_json["header"], "fill_value": fill_value}
+    features = copy.deepcopy(regional_json["features"])
+    for feature in features:
+        feature["properties"]["parameter"]["T2M"]["202201"] = fill_value
+
+    def get(url, params = None, **kwargs):
+        if url.endswith("/regional?"):
+            if not regional:
+                return SimpleNamespace(status_code = 422, url = url, headers = {}, content = b"")
+            content = orjson.dumps({**regional_json, "header": header, "features": features})
+        else:
+            content = orjson.dumps({"header": header, "properties": features[0]["properties"]})
+        return SimpleNamespace(status_code = 200, url = url, headers = {"content-disposition": "attachment; filename=power.json"},
+            content = content)
+
+    result = query_power_points(gdf_grid_points, start_monthly, end_monthly, temporal_api = "monthly", session = SimpleNamespace(get = get),
+        dtype = dtype)
+
+    for frame in result:
+        assert (frame.dtypes == dtype).all()
+        assert np.isnan(frame.loc["202201", "T2M"])
+        assert not frame.loc["202202":, "T2M"].isna().any()
+
+@pytest.mark.parametrize("stamps, temporal_api, expected", [
+    (["20220101", "20220102", "20220103"], "daily", ["2022-01-01", "2022-01-02", "2022-01-03"]),
+    (["20220101", "20220103", "20220104"], "daily", ["2022-01-01", "2022-01-03", "2022-01-04"]), # Gap, every stamp is parsed
+    (["2022010122", "2022010123", "2022010200"], "hourly", ["2022-01-01 22:00", "2022-01-01 23:00", "2022-01-02 00:00"]),
+    (["2022010100", "2022010105", "2022010106"], "hourly", ["2022-01-01 00:00", "2022-01-01 05:00", "2022-01-01 06:00"]), # Gap
+    ])
+def test_time_index(stamps, temporal_api, expected):
+    index = get_data._time_index(stamps, temporal_api)
+    assert isinstance(index, pd.DatetimeIndex)
+    assert list(index) == list(pd.to_datetime(expected))
+
+@pytest.mark.parametrize("low, high, limit_low, limit_high, expected", [
+    (37.3, 38.7, -90., 90., (37., 39.)),    # Widened around the middle
+    (10., 15., -90., 90., (10., 15.)),      # Already wide enough
+    (89.5, 89.9, -90., 90., (88., 90.)),    # Clamped at the north pole
+    (-90., -89.8, -90., 90., (-90., -88.)), # Clamped at the south pole
+    (179.9, 180., -180., 180., (178., 180.)),   # Clamped at the antimeridian
+    (-180., -179.5, -180., 180., (-180., -178.)), # Clamped at the antimeridian
+    ])
+def test_regional_range(low, high, limit_low, limit_high, expected):
+    assert get_data._regional_range(low, high, limit_low, limit_high) == pytest.approx(expected)
+
+params_many_invalid = [
+    ("gpoint", start, end, "ag", "hourly", TypeError),
+    (["gpoint", "gpoint"], start, end, "random", "hourly", ValueError),
+    (["gpoint", wrong_geom], start, end, "ag", "random", ValueError),
+    (["gpoint", "gpoint"], wrong_start_date_format, end, "ag", "daily", TypeError),
     ]
 
-@pytest.mark.parametrize("geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format", params_valid_json,)
-def test_get_data_valid_json(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format):
-    result = query_power(geometry, start, end, to_file, path, community, parameters, temporal_api, spatial_api, format)
-    assert isinstance(result, dict)
\ No newline at end of file
+@pytest.mark.parametrize("geometries, start, end, community, temporal_api, exception", params_many_invalid, ids = name_exception)
+def test_query_power_many_invalid(request, geometries, start, end, community, temporal_api, exception):
+    with expect(exception):
+        result = query_power_many(resolve(request, geometries), start, end, False, "./", community, [], temporal_api)